@@ -1,12 +1,42 @@
 import os
 import configparser
-from threading import Timer
+import sys
+from threading import Event, Lock, Thread, current_thread
 from pygame import mixer
 from termcolor import colored
 from colorama import init
-import drawings
 
 CONFIG_FILE = 'config.txt'
+_HERE = os.path.dirname(os.path.abspath(__file__)) # Script directory, computed once
+CONFIG_FLUSH_INTERVAL = 2.0 # Seconds between batched config writes
+
+_config_dirty = False
+_config_lock = Lock()
+_config_write_failed = False
+
+# Status line color codes from termcolor (empty when colors are disabled)
+_STATUS_PREFIX, _STATUS_SUFFIX = colored("{}", "yellow", attrs=["bold"]).split("{}")
+
+# Static colored strings, built once at import
+_BANNER_UP = colored("#" * 80, "yellow")
+_BANNER_DOWN = colored("-" * 80, "yellow")
+_DESCRIPTION = colored("\n\nStay aware of the minimap — for bad players only :)", "cyan", attrs=["bold"])
+_HELP_TEXT = colored(
+    "Available commands:\n"
+    "   -v <volume (0–100%)>\n"
+    "   -d <delay (s)>\n"
+    "   -s <sound_file.ext>\n"
+    "   quit\n",
+    "green",
+    attrs=["bold"]
+)
+_BAD_CMD = colored("⚠️  Invalid command. Try:", "red")
+_BAD_VOLUME = colored("⚠️  Invalid volume value.", "red")
+_BAD_DELAY = colored("⚠️  Invalid delay value.", "red")
+_BAD_SOUND = colored("⚠️  Invalid sound filename/path.", "red")
+_PAUSED = colored("Timer paused.", "yellow")
+_RESUMED = colored("Timer resumed.", "green")
+_EXITING = colored("Exiting program.", "yellow", attrs=["bold"])
 
 
 
@@ -18,28 +48,34 @@ class RepeatTimer:
         self.function = function
         self.args = args
         self.kwargs = kwargs
-        self._timer = None
+        self._stop = Event()
+        self._thread = None
         self.is_running = False
         self.start()
 
-    def _run(self):
-        """Internal: run the function, then reschedule."""
-        self.is_running = False
-        self.start()
-        self.function(*self.args, **self.kwargs)
+    def _loop(self, stop):
+        """Internal: wait for the interval, then run the function, until stopped."""
+        # interval is re-read on each wait, so updates apply from the next tick
+        while not stop.wait(self.interval):
+            try:
+                self.function(*self.args, **self.kwargs)
+            except Exception as e:
+                # Report and keep ticking; one failure must not kill the timer
+                print(colored(f"⚠️  Timer error: {e}", "red"))
 
     def start(self):
         """Start the repeating timer."""
         if not self.is_running:
-            self._timer = Timer(self.interval, self._run)
-            self._timer.daemon = True  # Avoid blocking program exit
-            self._timer.start()
+            self._stop = Event() # Fresh event so a stopped loop can't resume
+            self._thread = Thread(target=self._loop, args=(self._stop,), daemon=True) # Avoid blocking program exit
+            self._thread.start()
             self.is_running = True
 
-    def stop(self):
-        """Stop the repeating timer."""
-        if self._timer:
-            self._timer.cancel()
+    def stop(self, join=False):
+        """Stop the repeating timer; with join=True, wait for a running call to finish."""
+        self._stop.set()
+        if join and self._thread and self._thread is not current_thread():
+            self._thread.join()
         self.is_running = False         
 
 
@@ -54,9 +90,15 @@ class BeepController:
         self.volume = volume
         self.paused = False
 
-        mixer.init()
+        if not mixer.get_init(): # Skip re-initializing an already running mixer
+            # Pin rate and a small 512-sample buffer explicitly (pygame 2's defaults)
+            mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+            mixer.init()
         try:
-            mixer.music.load(sound)
+            # Preloaded in-memory buffer: no decode work per beep
+            self._snd = mixer.Sound(sound)
+            self._snd.set_volume(volume / 100.0) # Volume = [0, 1]
+            self._play = self._snd.play # Bound once for the timer's hot path
         except Exception as e:
             print(colored(f"⚠️  Error loading sound '{sound}': {e}", "red"))
             exit(1)
@@ -67,38 +109,43 @@ class BeepController:
     def dong(self):
         """Play the beep sound."""
         if not self.paused: 
-            mixer.music.set_volume(self.volume / 100.0)  # Volume = [0, 1]
-            mixer.music.play()
+            self._play()
 
     def set_volume(self, volume: int):
         """Set the volume for the beep sound."""
         self.volume = volume
-        print(colored(f"[INFO] - Volume : {int(self.volume)}%  |  Delay : {self.delay}s\n", "yellow", attrs=["bold"]))
+        self._snd.set_volume(volume / 100.0)
+        print_status(self.volume, self.delay)
 
     def set_delay(self, delay: float):
         """Set the delay interval for the beep sound."""
         self.delay = delay
         self.timer.interval = delay # Update timer interval
-        print(colored(f"[INFO] - Volume : {int(self.volume)}%  |  Delay : {self.delay}s\n", "yellow", attrs=["bold"]))
+        print_status(self.volume, self.delay)
 
-    def set_sound(self, sound: str):
-        """Set a new sound file for the beep."""
+    def set_sound(self, sound: str) -> bool:
+        """Set a new sound file for the beep; return whether it loaded."""
         try:
+            snd = mixer.Sound(sound)
+            snd.set_volume(self.volume / 100.0)
             self.sound = sound
-            mixer.music.load(sound)
+            self._snd = snd
+            self._play = snd.play
             print(colored(f"New sound loaded: {sound}", "yellow"))
+            return True
         except Exception as e:
             print(colored(f"⚠️  Error loading sound '{sound}': {e}", "red"))
+            return False
     
     def pause(self):
         """Pause the beep timer."""
         self.paused = True
-        print(colored("Timer paused.", "yellow"))
+        print(_PAUSED)
 
     def resume(self):
         """Resume the beep timer."""
         self.paused = False
-        print(colored("Timer resumed.", "green"))
+        print(_RESUMED)
 
     def stop(self):
         """Stop the beep timer."""
@@ -106,6 +153,21 @@ class BeepController:
 
 
 
+def _atomic_write_config(config):
+    """Write the config to a temp file, then swap it in so readers never see a partial file."""
+    tmp = CONFIG_FILE + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            config.write(f)
+        os.replace(tmp, CONFIG_FILE)
+    except Exception:
+        # Don't leave a stale temp file behind
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 def load_config():
     """Load config file or create default one if missing."""
 
@@ -118,34 +180,58 @@ def load_config():
             "delay": "7",
             "volume": "20"
         }
-        with open(CONFIG_FILE, "w") as f:
-            config.write(f)
+        _atomic_write_config(config)
     else:
         # Load existing config
         config.read(CONFIG_FILE)
 
     return config
 
+def _mark_config_dirty():
+    """Flag the in-memory config as changed so the next flush writes it."""
+    global _config_dirty
+    _config_dirty = True
+
+def _flush_config_if_dirty(config):
+    """Write the config file only if it changed since the last flush."""
+    global _config_dirty, _config_write_failed
+    with _config_lock: # Timer thread and quit path may flush concurrently
+        if not _config_dirty:
+            return
+        _config_dirty = False
+        try:
+            _atomic_write_config(config)
+        except Exception as e:
+            _config_dirty = True # Retry on the next flush
+            if not _config_write_failed: # Report once until a write succeeds
+                print(colored(f"⚠️  Could not save {CONFIG_FILE}: {e}", "red"))
+                _config_write_failed = True
+            return
+        _config_write_failed = False
+
+def print_status(volume, delay):
+    """Print the volume/delay status line."""
+    print(f"{_STATUS_PREFIX}[INFO] - Volume : {int(volume)}%  |  Delay : {delay}s\n{_STATUS_SUFFIX}")
+
 def print_banner():
     """Display welcome banner with ASCII art."""
+    import drawings # Only needed here, loaded lazily
 
-    up_border = "#" * 80
-    down_border = "-" * 80
     magikarp_art = drawings.bipmap  # Import ASCII art 
-    description = "\n\nStay aware of the minimap — for bad players only :)"
 
     # Display
-    print(colored(up_border, "yellow"))
+    print(_BANNER_UP)
     print(colored(magikarp_art, "red"))
-    print(colored(description, "cyan", attrs=["bold"]))
-    print(colored(down_border, "yellow"))
+    print(_DESCRIPTION)
+    print(_BANNER_DOWN)
     print("\nUsage: Please enter the path to your sound file (wav or mp3) you want to play in config.txt.\n")
 
 def init_app():
     """Initialize terminal, display, sound, and load configuration."""
 
     init() # Initialize colorama
-    os.system("cls" if os.name == "nt" else "clear") # Clear terminal
+    sys.stdout.write("\x1b[2J\x1b[H") # Clear terminal (ANSI, no subprocess)
+    sys.stdout.flush()
 
     # Display welcome message
     print_banner()
@@ -156,24 +242,70 @@ def init_app():
     delay = int(config["DEFAULT"].get("delay"))
     volume = int(config["DEFAULT"].get("volume"))
 
-    print(colored(
-        "Available commands:\n"
-        "   -v <volume (0–100%)>\n"
-        "   -d <delay (s)>\n"
-        "   -s <sound_file.ext>\n"
-        "   quit\n",
-        "green",
-        attrs=["bold"]
-    ))
-    print(colored(f"[INFO] - Volume : {int(volume)}%  |  Delay : {delay}s\n", "yellow", attrs=["bold"]))
+    print(_HELP_TEXT)
+    print_status(volume, delay)
     return delay, volume, sound, config
 
 def validate_sound(sound_path: str) -> bool:
     """Check if the sound file exists; support relative/absolute paths."""
     if not os.path.isabs(sound_path):
-        sound_path = os.path.join(os.path.dirname(__file__), sound_path)
+        sound_path = os.path.join(_HERE, sound_path)
     return os.path.isfile(sound_path)
 
+def _handle_volume(beeper, arg, config):
+    """Set volume command."""
+    try:
+        new_volume = int(arg)
+        if new_volume > 100 or new_volume < 0:
+            raise ValueError
+        beeper.set_volume(new_volume)
+
+        # Update config (written by the batched flusher)
+        config["DEFAULT"]["volume"] = str(new_volume)
+        _mark_config_dirty()
+
+    except ValueError:
+        print(_BAD_VOLUME)
+
+def _handle_delay(beeper, arg, config):
+    """Set delay command."""
+    try:
+        new_delay = int(arg)
+        beeper.set_delay(new_delay)
+
+        # Update config (written by the batched flusher)
+        config["DEFAULT"]["delay"] = str(new_delay)
+        _mark_config_dirty()
+
+    except ValueError:
+        print(_BAD_DELAY)
+
+def _handle_sound(beeper, arg, config):
+    """Set sound command."""
+    try:
+        if not validate_sound(arg):
+            raise FileNotFoundError
+        if not beeper.set_sound(arg):
+            return # Previous sound kept, so leave the config unchanged
+
+        # Update config (written by the batched flusher)
+        config["DEFAULT"]["sound"] = arg
+        _mark_config_dirty()
+
+    except Exception:
+        print(_BAD_SOUND)
+
+# Command dispatch table: first word of the input -> handler(beeper, arg, config)
+HANDLERS = {
+    "-v": _handle_volume,
+    "-d": _handle_delay,
+    "-s": _handle_sound,
+    "pause": lambda beeper, arg, config: beeper.pause(),
+    "resume": lambda beeper, arg, config: beeper.resume(),
+}
+NO_ARG = frozenset({"pause", "resume"}) # Commands that take no argument
+QUIT = frozenset({"exit", "exit()", "stop", "stop()", "quit", "quit()", "q"})
+
 def main():
     """Main control loop."""
     delay, volume, sound, config = init_app()
@@ -186,83 +318,34 @@ def main():
     # Initialize BeepController
     beeper = BeepController(sound, delay, volume)
 
-    while True:
-        # Get user command
-        cmd=input("> ").strip()
-        
-        if cmd.startswith("-v "):
-            # Set volume command
-            try:
-                new_volume = int(cmd.split()[1])
-                if new_volume > 100 or new_volume < 0:
-                    raise ValueError
-                beeper.set_volume(new_volume)
-
-                # Update config file
-                config["DEFAULT"]["volume"] = str(new_volume)
-                with open(CONFIG_FILE, "w") as f:
-                    config.write(f)
-
-            except (ValueError, IndexError):
-                print(colored("⚠️  Invalid volume value.", "red"))
-
-        elif cmd.startswith("-d "):
-            # Set delay command
-            try:
-                new_delay = int(cmd.split()[1])
-                beeper.set_delay(new_delay)
-
-                # Update config file
-                config["DEFAULT"]["delay"] = str(new_delay)
-                with open(CONFIG_FILE, "w") as f:
-                    config.write(f)
-
-            except (ValueError, IndexError):
-                print(colored("⚠️  Invalid delay value.", "red"))
-
-        elif cmd.startswith("-s "):
-            # Set sound command
-            try:
-                new_sound = cmd.split(" ", 1)[1]
-                validate_sound(new_sound)
-                if not validate_sound(new_sound):
-                    raise FileNotFoundError
-                beeper.set_sound(new_sound)
-
-                # Update config file
-                config["DEFAULT"]["sound"] = new_sound
-                with open(CONFIG_FILE, "w") as f:
-                    config.write(f)
-
-            except Exception:
-                print(colored("⚠️  Invalid sound filename/path.", "red"))
-        
-        elif cmd == "pause":
-            # Pause command
-            beeper.pause()
-
-        elif cmd == "resume":
-            # Resume command
-            beeper.resume()
-        
-        elif cmd in ("exit","exit()", "stop", "stop()", "quit", "quit()", "q"):
-            # Exit command
-            beeper.stop()
-            print(colored("Exiting program.", "yellow", attrs=["bold"]))
-            break
-
-        else:
-            # Invalid command
-            print(colored("⚠️  Invalid command. Try:", "red"))
-            print(colored(
-                "Available commands:\n"
-                "   -v <volume (0–100%)>\n"
-                "   -d <delay (s)>\n"
-                "   -s <sound_file.ext>\n"
-                "   quit\n",
-                "green",
-                attrs=["bold"]
-            ))
+    # Batch config writes instead of writing on every command
+    config_flusher = RepeatTimer(CONFIG_FLUSH_INTERVAL, _flush_config_if_dirty, config)
+
+    try:
+        while True:
+            # Get user command
+            cmd=input("> ").strip()
+            head, _, arg = cmd.partition(" ")
+
+            if cmd in QUIT:
+                # Exit command
+                print(_EXITING)
+                break
+
+            arg = arg.strip()
+            handler = HANDLERS.get(head)
+            # Flags need an argument and plain commands must have none
+            if handler and (head in NO_ARG) != bool(arg):
+                handler(beeper, arg, config)
+            else:
+                # Invalid command
+                print(_BAD_CMD)
+                print(_HELP_TEXT)
+    finally:
+        # Also runs on Ctrl+C / EOF so pending config changes are saved
+        beeper.stop()
+        config_flusher.stop(join=True) # Let an in-progress flush finish
+        _flush_config_if_dirty(config)
 
 
 